@@ -1,3 +1,4 @@
+import operator
 from enum import Enum
 
 
@@ -19,21 +20,45 @@ class BinaryOperator(Enum):
     AND = "and"
 
 
+def is_in(a, b):
+    return a in b
+
+
+def str_starts_with(a, b):
+    return a.startswith(b)
+
+
+def str_ends_with(a, b):
+    return a.endswith(b)
+
+
+def str_contains(a, b):
+    return b in a
+
+
+def binary_and(a, b):
+    return a and b
+
+
+def binary_or(a, b):
+    return a or b
+
+
 OPERATORS_FUNCTIONS = {
-    Operator.EQUAL: lambda a, b: a == b,
-    Operator.NOT_EQUAL: lambda a, b: a != b,
-    Operator.LOWER_THAN: lambda a, b: a < b,
-    Operator.GREATER_THAN: lambda a, b: a > b,
-    Operator.LOWER_THAN_OR_EQUAL: lambda a, b: a <= b,
-    Operator.GREATER_THAN_OR_EQUAL: lambda a, b: a >= b,
-    Operator.IN: lambda a, b: a in b,
-    Operator.STR_STARTS_WITH: lambda a, b: a.startswith(b),
-    Operator.STR_ENDS_WITH: lambda a, b: a.endswith(b),
-    Operator.STR_CONTAINS: lambda a, b: b in a,
+    Operator.EQUAL: operator.eq,
+    Operator.NOT_EQUAL: operator.ne,
+    Operator.LOWER_THAN: operator.lt,
+    Operator.GREATER_THAN: operator.gt,
+    Operator.LOWER_THAN_OR_EQUAL: operator.le,
+    Operator.GREATER_THAN_OR_EQUAL: operator.ge,
+    Operator.IN: is_in,
+    Operator.STR_STARTS_WITH: str_starts_with,
+    Operator.STR_ENDS_WITH: str_ends_with,
+    Operator.STR_CONTAINS: str_contains,
 }
 
 
 BINARY_OPERATORS_FUNCTIONS = {
-    BinaryOperator.AND: lambda a, b: a and b,
-    BinaryOperator.OR: lambda a, b: a or b,
+    BinaryOperator.AND: binary_and,
+    BinaryOperator.OR: binary_or,
 }
@@ -3,7 +3,7 @@ from typing import Any, Dict, List, Literal, Tuple, Type, Union
 import numpy as np
 from pydantic import AliasChoices, ConfigDict, Field, PositiveInt
 
-from inference.core.utils.image_utils import ImageType, load_image
+from inference.core.utils.image_utils import ImageType, load_image_bgr
 from inference.core.workflows.constants import (
     IMAGE_TYPE_KEY,
     IMAGE_VALUE_KEY,
@@ -99,11 +99,8 @@ class AbsoluteStaticCropBlock(WorkflowBlock):
         width: int,
         height: int,
     ) -> Union[List[Dict[str, Any]], Tuple[List[Dict[str, Any]], FlowControl]]:
-        decoded_images = [load_image(e) for e in images]
+        decoded_images = [load_image_bgr(e) for e in images]
         images_parents = [i[PARENT_ID_KEY] for i in images]
-        decoded_images = [
-            i[0] if i[1] is True else i[0][:, :, ::-1] for i in decoded_images
-        ]
         origin_image_shape = extract_origin_size_from_images_batch(
             input_images=images,
             decoded_images=decoded_images,
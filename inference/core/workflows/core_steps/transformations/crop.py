@@ -4,7 +4,7 @@ from typing import Any, Dict, List, Literal, Tuple, Type, Union
 import numpy as np
 from pydantic import AliasChoices, ConfigDict, Field
 
-from inference.core.utils.image_utils import ImageType, load_image
+from inference.core.utils.image_utils import ImageType, load_image_bgr
 from inference.core.workflows.constants import (
     DETECTION_ID_KEY,
     HEIGHT_KEY,
@@ -18,7 +18,6 @@ from inference.core.workflows.constants import (
     WIDTH_KEY,
 )
 from inference.core.workflows.core_steps.common.utils import (
-    detection_to_xyxy,
     extract_origin_size_from_images_batch,
 )
 from inference.core.workflows.entities.base import OutputDefinition
@@ -95,10 +94,7 @@ class CropBlock(WorkflowBlock):
         images: List[dict],
         predictions: List[List[dict]],
     ) -> Tuple[List[Any], FlowControl]:
-        decoded_images = [load_image(e) for e in images]
-        decoded_images = [
-            i[0] if i[1] is True else i[0][:, :, ::-1] for i in decoded_images
-        ]
+        decoded_images = [load_image_bgr(e) for e in images]
         origin_image_shape = extract_origin_size_from_images_batch(
             input_images=images,
             decoded_images=decoded_images,
@@ -121,9 +117,25 @@ def crop_image(
     detections: List[dict],
     origin_size: dict,
 ) -> List[Dict[str, Union[dict, str]]]:
+    if not detections:
+        return []
+    coordinates = np.array(
+        [
+            [
+                detection["x"],
+                detection["y"],
+                detection[WIDTH_KEY],
+                detection[HEIGHT_KEY],
+            ]
+            for detection in detections
+        ]
+    )
+    left_top = np.rint(coordinates[:, :2] - coordinates[:, 2:] / 2).astype(int)
+    right_bottom = np.rint(left_top + coordinates[:, 2:]).astype(int)
     crops = []
-    for detection in detections:
-        x_min, y_min, x_max, y_max = detection_to_xyxy(detection=detection)
+    for detection, (x_min, y_min), (x_max, y_max) in zip(
+        detections, left_top.tolist(), right_bottom.tolist()
+    ):
         cropped_image = image[y_min:y_max, x_min:x_max]
         crops.append(
             {
@@ -1,6 +1,6 @@
-from copy import deepcopy
 from typing import Any, Callable, Dict, List, Literal, Tuple, Type, Union
 
+import numpy as np
 from pydantic import BaseModel, ConfigDict, Field
 from typing_extensions import Annotated
 
@@ -180,13 +180,16 @@ class DetectionFilterBlock(WorkflowBlock):
         image_metadata: List[dict],
         prediction_type: List[str],
     ) -> Union[List[Dict[str, Any]], Tuple[List[Dict[str, Any]], FlowControl]]:
-        filter_callable = build_filter_callable(definition=filter_definition)
         result_predictions, result_parent_id = [], []
         for detections in predictions:
+            filter_mask = build_filter_mask(
+                definition=filter_definition,
+                detections=detections,
+            )
             filtered_prediction = [
-                deepcopy(detection)
-                for detection in detections
-                if filter_callable(detection)
+                dict(detection)
+                for detection, should_persist in zip(detections, filter_mask)
+                if should_persist
             ]
             result_predictions.append(filtered_prediction)
             result_parent_id.append(
@@ -205,17 +208,74 @@ class DetectionFilterBlock(WorkflowBlock):
         ]
 
 
+COMPARISON_OPERATORS_UFUNCS = {
+    Operator.EQUAL: np.equal,
+    Operator.NOT_EQUAL: np.not_equal,
+    Operator.LOWER_THAN: np.less,
+    Operator.GREATER_THAN: np.greater,
+    Operator.LOWER_THAN_OR_EQUAL: np.less_equal,
+    Operator.GREATER_THAN_OR_EQUAL: np.greater_equal,
+}
+
+
+def build_filter_mask(
+    definition: Union[DetectionFilterDefinition, CompoundDetectionFilterDefinition],
+    detections: List[dict],
+) -> np.ndarray:
+    if definition.type == "CompoundDetectionFilterDefinition":
+        left_mask = build_filter_mask(definition=definition.left, detections=detections)
+        right_mask = build_filter_mask(
+            definition=definition.right, detections=detections
+        )
+        if definition.operator is BinaryOperator.AND:
+            return left_mask & right_mask
+        if definition.operator is BinaryOperator.OR:
+            return left_mask | right_mask
+        binary_operator = BINARY_OPERATORS_FUNCTIONS[definition.operator]
+        return np.fromiter(
+            (binary_operator(a, b) for a, b in zip(left_mask, right_mask)),
+            dtype=bool,
+            count=len(detections),
+        )
+    if definition.type == "DetectionFilterDefinition":
+        field_name = definition.field_name
+        reference_value = definition.reference_value
+        field_values = [detection[field_name] for detection in detections]
+        ufunc = COMPARISON_OPERATORS_UFUNCS.get(definition.operator)
+        if (
+            ufunc is not None
+            and isinstance(reference_value, (int, float))
+            and all(isinstance(value, (int, float)) for value in field_values)
+        ):
+            return ufunc(np.asarray(field_values), reference_value)
+        operator = OPERATORS_FUNCTIONS[definition.operator]
+        return np.fromiter(
+            (operator(value, reference_value) for value in field_values),
+            dtype=bool,
+            count=len(detections),
+        )
+    raise ValueError(
+        f"Detected filter definition of type {definition.type} which is unknown"
+    )
+
+
 def build_filter_callable(
     definition: Union[DetectionFilterDefinition, CompoundDetectionFilterDefinition],
 ) -> Callable[[dict], bool]:
     if definition.type == "CompoundDetectionFilterDefinition":
         left_callable = build_filter_callable(definition=definition.left)
         right_callable = build_filter_callable(definition=definition.right)
+        if definition.operator is BinaryOperator.AND:
+            return lambda e: left_callable(e) and right_callable(e)
+        if definition.operator is BinaryOperator.OR:
+            return lambda e: left_callable(e) or right_callable(e)
         binary_operator = BINARY_OPERATORS_FUNCTIONS[definition.operator]
         return lambda e: binary_operator(left_callable(e), right_callable(e))
     if definition.type == "DetectionFilterDefinition":
         operator = OPERATORS_FUNCTIONS[definition.operator]
-        return lambda e: operator(e[definition.field_name], definition.reference_value)
+        field_name = definition.field_name
+        reference_value = definition.reference_value
+        return lambda e: operator(e[field_name], reference_value)
     raise ValueError(
         f"Detected filter definition of type {definition.type} which is unknown"
     )
@@ -1,4 +1,3 @@
-from copy import deepcopy
 from typing import Any, Dict, List, Literal, Tuple, Type, Union
 from uuid import uuid4
 
@@ -155,7 +154,8 @@ class DetectionOffsetBlock(WorkflowBlock):
 def offset_detection(
     detection: Dict[str, Any], offset_width: int, offset_height: int
 ) -> Dict[str, Any]:
-    detection_copy = deepcopy(detection)
+    # shallow copy is enough - only flat fields of detection are overridden
+    detection_copy = dict(detection)
     detection_copy[WIDTH_KEY] += round(offset_width)
     detection_copy[HEIGHT_KEY] += round(offset_height)
     detection_copy[PARENT_ID_KEY] = detection_copy[DETECTION_ID_KEY]
@@ -1,6 +1,7 @@
 import itertools
-from collections import defaultdict
-from typing import Dict, List, Set, Tuple
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from typing import Dict, List, Set, Tuple, Type
 
 import networkx as nx
 from networkx import DiGraph
@@ -10,23 +11,20 @@ from inference.core.workflows.constants import (
     OUTPUT_NODE_KIND,
     STEP_NODE_KIND,
 )
-from inference.core.workflows.entities.base import (
-    InputType,
-    JsonField,
-    OutputDefinition,
-)
+from inference.core.workflows.entities.base import OutputDefinition
 from inference.core.workflows.entities.types import STEP_AS_SELECTED_ELEMENT, Kind
 from inference.core.workflows.errors import (
     ConditionalBranchesCollapseError,
     DanglingExecutionBranchError,
     ExecutionGraphStructureError,
     InvalidReferenceTargetError,
+    ReferenceTypeError,
 )
 from inference.core.workflows.execution_engine.compiler.entities import (
     ParsedWorkflowDefinition,
 )
 from inference.core.workflows.execution_engine.compiler.reference_type_checker import (
-    validate_reference_kinds,
+    reference_kinds_compatible,
 )
 from inference.core.workflows.execution_engine.compiler.utils import (
     FLOW_CONTROL_NODE_KEY,
@@ -34,8 +32,8 @@ from inference.core.workflows.execution_engine.compiler.utils import (
     construct_output_name,
     construct_step_selector,
     get_last_chunk_of_selector,
-    get_nodes_of_specific_kind,
     get_step_selector_from_its_output,
+    group_nodes_by_kind,
     is_flow_control_step,
     is_input_selector,
     is_step_output_selector,
@@ -50,105 +48,135 @@ from inference.core.workflows.execution_engine.introspection.selectors_parser im
 from inference.core.workflows.prototypes.block import WorkflowBlockManifest
 
 NODE_DEFINITION_KEY = "definition"
+STEPS_TOPOLOGICAL_ORDER_KEY = "steps_topological_order"
 
 
 def prepare_execution_graph(
     workflow_definition: ParsedWorkflowDefinition,
 ) -> DiGraph:
+    actual_outputs_cache = {}
     execution_graph = construct_graph(
         workflow_definition=workflow_definition,
+        actual_outputs_cache=actual_outputs_cache,
     )
-    if not nx.is_directed_acyclic_graph(execution_graph):
+    try:
+        cycle = nx.find_cycle(execution_graph)
+    except nx.NetworkXNoCycle:
+        cycle = None
+    if cycle is not None:
+        nodes_in_cycle = [edge[0] for edge in cycle]
         raise ExecutionGraphStructureError(
             public_message=f"Detected cycle in execution graph. This means that there is output from one "
             f"step that is connected to input of other step creating loop in the graph that would "
-            f"never end if executed.",
+            f"never end if executed. Nodes involved in cycle: {nodes_in_cycle}.",
             context="workflow_compilation | execution_graph_construction",
         )
+    nodes_by_kind = group_nodes_by_kind(execution_graph=execution_graph)
     verify_each_node_reach_at_least_one_output(
         execution_graph=execution_graph,
+        actual_outputs_cache=actual_outputs_cache,
+        nodes_by_kind=nodes_by_kind,
+    )
+    verify_each_node_step_has_parent_in_the_same_branch(
+        execution_graph=execution_graph,
+        nodes_by_kind=nodes_by_kind,
     )
-    verify_each_node_step_has_parent_in_the_same_branch(execution_graph=execution_graph)
     return execution_graph
 
 
 def construct_graph(
     workflow_definition: ParsedWorkflowDefinition,
+    actual_outputs_cache: Dict[int, List[OutputDefinition]],
 ) -> DiGraph:
     execution_graph = nx.DiGraph()
-    execution_graph = add_input_nodes_for_graph(
-        inputs=workflow_definition.inputs,
-        execution_graph=execution_graph,
-    )
-    execution_graph = add_steps_nodes_for_graph(
-        steps=workflow_definition.steps,
-        execution_graph=execution_graph,
-    )
-    execution_graph = add_output_nodes_for_graph(
-        outputs=workflow_definition.outputs,
+    execution_graph = add_workflow_nodes_for_graph(
+        workflow_definition=workflow_definition,
         execution_graph=execution_graph,
     )
     execution_graph = add_steps_edges(
         workflow_definition=workflow_definition,
         execution_graph=execution_graph,
+        actual_outputs_cache=actual_outputs_cache,
     )
     return add_edges_for_outputs(
         workflow_definition=workflow_definition,
         execution_graph=execution_graph,
+        actual_outputs_cache=actual_outputs_cache,
     )
 
 
-def add_input_nodes_for_graph(
-    inputs: List[InputType],
-    execution_graph: DiGraph,
-) -> DiGraph:
-    for input_spec in inputs:
-        input_selector = construct_input_selector(input_name=input_spec.name)
-        execution_graph.add_node(
-            input_selector,
-            kind=INPUT_NODE_KIND,
-            definition=input_spec,
-        )
-    return execution_graph
-
+# resolution of get_actual_outputs is cached per manifest type - block
+# classes are defined at module level, so the table stays bounded by the
+# number of loaded block types
+GET_ACTUAL_OUTPUTS_METHODS_CACHE = {}
 
-def add_steps_nodes_for_graph(
-    steps: List[WorkflowBlockManifest],
-    execution_graph: DiGraph,
-) -> DiGraph:
-    for step in steps:
-        step_selector = construct_step_selector(step_name=step.name)
-        execution_graph.add_node(
-            step_selector,
-            kind=STEP_NODE_KIND,
-            definition=step,
-        )
-    return execution_graph
 
-
-def add_output_nodes_for_graph(
-    outputs: List[JsonField],
+def get_manifest_actual_outputs(
+    step_manifest: WorkflowBlockManifest,
+    actual_outputs_cache: Dict[int, List[OutputDefinition]],
+) -> List[OutputDefinition]:
+    # manifests are repeatedly asked for outputs while edges and verifiers
+    # are processed - results are memoized for the time of compilation
+    manifest_key = id(step_manifest)
+    if manifest_key not in actual_outputs_cache:
+        manifest_type = type(step_manifest)
+        method = GET_ACTUAL_OUTPUTS_METHODS_CACHE.get(manifest_type)
+        if method is None:
+            method = manifest_type.get_actual_outputs
+            GET_ACTUAL_OUTPUTS_METHODS_CACHE[manifest_type] = method
+        actual_outputs_cache[manifest_key] = method(step_manifest)
+    return actual_outputs_cache[manifest_key]
+
+
+def add_workflow_nodes_for_graph(
+    workflow_definition: ParsedWorkflowDefinition,
     execution_graph: DiGraph,
 ) -> DiGraph:
-    for output_spec in outputs:
-        execution_graph.add_node(
-            construct_output_name(name=output_spec.name),
-            kind=OUTPUT_NODE_KIND,
-            definition=output_spec,
+    # inputs, steps and outputs nodes are inserted in a single
+    # add_nodes_from call over chained generators
+    execution_graph.add_nodes_from(
+        itertools.chain(
+            (
+                (
+                    construct_input_selector(input_name=input_spec.name),
+                    {"kind": INPUT_NODE_KIND, NODE_DEFINITION_KEY: input_spec},
+                )
+                for input_spec in workflow_definition.inputs
+            ),
+            (
+                (
+                    construct_step_selector(step_name=step.name),
+                    {"kind": STEP_NODE_KIND, NODE_DEFINITION_KEY: step},
+                )
+                for step in workflow_definition.steps
+            ),
+            (
+                (
+                    construct_output_name(name=output_spec.name),
+                    {"kind": OUTPUT_NODE_KIND, NODE_DEFINITION_KEY: output_spec},
+                )
+                for output_spec in workflow_definition.outputs
+            ),
         )
+    )
     return execution_graph
 
 
 def add_steps_edges(
     workflow_definition: ParsedWorkflowDefinition,
     execution_graph: DiGraph,
+    actual_outputs_cache: Dict[int, List[OutputDefinition]],
 ) -> DiGraph:
+    expected_kinds_cache = {}
     for step in workflow_definition.steps:
         step_selectors = get_step_selectors(step_manifest=step)
         execution_graph = add_edges_for_step(
             execution_graph=execution_graph,
             step_name=step.name,
+            step_manifest_type=type(step),
             parsed_selectors=step_selectors,
+            actual_outputs_cache=actual_outputs_cache,
+            expected_kinds_cache=expected_kinds_cache,
         )
     return execution_graph
 
@@ -156,14 +184,20 @@ def add_steps_edges(
 def add_edges_for_step(
     execution_graph: DiGraph,
     step_name: str,
+    step_manifest_type: Type[WorkflowBlockManifest],
     parsed_selectors: List[ParsedSelector],
+    actual_outputs_cache: Dict[int, List[OutputDefinition]],
+    expected_kinds_cache: Dict[Tuple[Type[WorkflowBlockManifest], str], List[Kind]],
 ) -> DiGraph:
     step_selector = construct_step_selector(step_name=step_name)
     for parsed_selector in parsed_selectors:
         execution_graph = add_edge_for_step(
             execution_graph=execution_graph,
             step_selector=step_selector,
+            step_manifest_type=step_manifest_type,
             parsed_selector=parsed_selector,
+            actual_outputs_cache=actual_outputs_cache,
+            expected_kinds_cache=expected_kinds_cache,
         )
     return execution_graph
 
@@ -171,15 +205,19 @@ def add_edges_for_step(
 def add_edge_for_step(
     execution_graph: DiGraph,
     step_selector: str,
+    step_manifest_type: Type[WorkflowBlockManifest],
     parsed_selector: ParsedSelector,
+    actual_outputs_cache: Dict[int, List[OutputDefinition]],
+    expected_kinds_cache: Dict[Tuple[Type[WorkflowBlockManifest], str], List[Kind]],
 ) -> DiGraph:
     other_step_selector = get_step_selector_from_its_output(
         step_output_selector=parsed_selector.value
     )
-    verify_edge_is_created_between_existing_nodes(
+    # step_selector node existence is guaranteed - it was added while
+    # registering nodes for each step of the workflow definition
+    verify_node_exists(
         execution_graph=execution_graph,
-        start=step_selector,
-        end=other_step_selector,
+        node=other_step_selector,
     )
     if is_step_selector(parsed_selector.value):
         return establish_flow_control_edge(
@@ -198,23 +236,32 @@ def add_edge_for_step(
         actual_input_kind = get_kind_of_value_provided_in_step_output(
             step_manifest=other_step_manifest,
             step_property=get_last_chunk_of_selector(selector=parsed_selector.value),
+            actual_outputs_cache=actual_outputs_cache,
         )
-    expected_input_kind = list(
-        itertools.chain.from_iterable(
-            ref.kind for ref in parsed_selector.definition.allowed_references
+    # keyed by value, not by id() - selector definitions are re-created per
+    # step and their addresses can be recycled within one compilation
+    definition_key = (step_manifest_type, parsed_selector.definition.property_name)
+    expected_input_kind = expected_kinds_cache.get(definition_key)
+    if expected_input_kind is None:
+        expected_input_kind = list(
+            itertools.chain.from_iterable(
+                ref.kind for ref in parsed_selector.definition.allowed_references
+            )
         )
-    )
-    error_message = (
-        f"Failed to validate reference provided for step: {step_selector} regarding property: "
-        f"{parsed_selector.definition.property_name} with value: {parsed_selector.value}. "
-        f"Allowed kinds of references for this property: {list(set(e.name for e in expected_input_kind))}. "
-        f"Types of output for referred property: {list(set(a.name for a in actual_input_kind))}"
-    )
-    validate_reference_kinds(
+        expected_kinds_cache[definition_key] = expected_input_kind
+    if not reference_kinds_compatible(
         expected=expected_input_kind,
         actual=actual_input_kind,
-        error_message=error_message,
-    )
+    ):
+        # error message (with its kind-name deduplication) is only built
+        # when the reference actually fails validation
+        raise ReferenceTypeError(
+            public_message=f"Failed to validate reference provided for step: {step_selector} regarding property: "
+            f"{parsed_selector.definition.property_name} with value: {parsed_selector.value}. "
+            f"Allowed kinds of references for this property: {list(set(e.name for e in expected_input_kind))}. "
+            f"Types of output for referred property: {list(set(a.name for a in actual_input_kind))}",
+            context="workflow_compilation | execution_graph_construction",
+        )
     execution_graph.add_edge(other_step_selector, step_selector)
     return execution_graph
 
@@ -253,8 +300,12 @@ def step_definition_allows_flow_control_references(
 def get_kind_of_value_provided_in_step_output(
     step_manifest: WorkflowBlockManifest,
     step_property: str,
+    actual_outputs_cache: Dict[int, List[OutputDefinition]],
 ) -> List[Kind]:
-    referred_node_outputs = step_manifest.get_actual_outputs()
+    referred_node_outputs = get_manifest_actual_outputs(
+        step_manifest=step_manifest,
+        actual_outputs_cache=actual_outputs_cache,
+    )
     actual_kind = []
     matched_property = False
     for output in referred_node_outputs:
@@ -292,6 +343,7 @@ def add_edges_for_step_inputs(
 def add_edges_for_outputs(
     workflow_definition: ParsedWorkflowDefinition,
     execution_graph: DiGraph,
+    actual_outputs_cache: Dict[int, List[OutputDefinition]],
 ) -> DiGraph:
     for output in workflow_definition.outputs:
         node_selector = output.selector
@@ -300,14 +352,18 @@ def add_edges_for_outputs(
                 step_output_selector=node_selector
             )
         output_name = construct_output_name(name=output.name)
-        verify_edge_is_created_between_existing_nodes(
+        # output_name node existence is guaranteed - it was added while
+        # registering nodes for each declared workflow output
+        verify_node_exists(
             execution_graph=execution_graph,
-            start=node_selector,
-            end=output_name,
+            node=node_selector,
         )
         if is_step_output_selector(selector_or_value=output.selector):
             step_manifest = execution_graph.nodes[node_selector][NODE_DEFINITION_KEY]
-            step_outputs = step_manifest.get_actual_outputs()
+            step_outputs = get_manifest_actual_outputs(
+                step_manifest=step_manifest,
+                actual_outputs_cache=actual_outputs_cache,
+            )
             verify_output_selector_points_to_valid_output(
                 output_selector=output.selector,
                 step_outputs=step_outputs,
@@ -321,14 +377,17 @@ def verify_edge_is_created_between_existing_nodes(
     start: str,
     end: str,
 ) -> None:
-    if not execution_graph.has_node(start):
-        raise InvalidReferenceTargetError(
-            public_message=f"Graph definition contains selector {start} that points to not defined element.",
-            context="workflow_compilation | execution_graph_construction",
-        )
-    if not execution_graph.has_node(end):
+    verify_node_exists(execution_graph=execution_graph, node=start)
+    verify_node_exists(execution_graph=execution_graph, node=end)
+
+
+def verify_node_exists(
+    execution_graph: DiGraph,
+    node: str,
+) -> None:
+    if not execution_graph.has_node(node):
         raise InvalidReferenceTargetError(
-            public_message=f"Graph definition contains selector {end} that points to not defined element.",
+            public_message=f"Graph definition contains selector {node} that points to not defined element.",
             context="workflow_compilation | execution_graph_construction",
         )
 
@@ -351,13 +410,15 @@ def verify_output_selector_points_to_valid_output(
 
 def verify_each_node_reach_at_least_one_output(
     execution_graph: DiGraph,
+    actual_outputs_cache: Dict[int, List[OutputDefinition]],
+    nodes_by_kind: Dict[str, Set[str]],
 ) -> None:
     all_nodes = set(execution_graph.nodes())
-    output_nodes = get_nodes_of_specific_kind(
-        execution_graph=execution_graph, kind=OUTPUT_NODE_KIND
-    )
+    output_nodes = nodes_by_kind.get(OUTPUT_NODE_KIND, set())
     nodes_without_outputs = get_nodes_that_do_not_produce_outputs(
         execution_graph=execution_graph,
+        actual_outputs_cache=actual_outputs_cache,
+        step_nodes=nodes_by_kind.get(STEP_NODE_KIND, set()),
     )
     nodes_that_must_be_reached = output_nodes.union(nodes_without_outputs)
     nodes_reaching_output = (
@@ -377,16 +438,19 @@ def verify_each_node_reach_at_least_one_output(
 
 def get_nodes_that_do_not_produce_outputs(
     execution_graph: DiGraph,
+    actual_outputs_cache: Dict[int, List[OutputDefinition]],
+    step_nodes: Set[str],
 ) -> Set[str]:
     # assumption is that nodes without outputs will produce some side effect and shall be
     # treated as output nodes while checking if there is no dangling steps in graph
-    step_nodes = get_nodes_of_specific_kind(
-        execution_graph=execution_graph, kind=STEP_NODE_KIND
-    )
     result = set()
     for step_node in step_nodes:
         step_manifest = execution_graph.nodes[step_node][NODE_DEFINITION_KEY]
-        if not step_manifest.get_actual_outputs():
+        step_outputs = get_manifest_actual_outputs(
+            step_manifest=step_manifest,
+            actual_outputs_cache=actual_outputs_cache,
+        )
+        if not step_outputs:
             result.add(step_node)
     return result
 
@@ -395,18 +459,22 @@ def get_nodes_that_are_reachable_from_pointed_ones_in_reversed_graph(
     execution_graph: DiGraph,
     pointed_nodes: Set[str],
 ) -> Set[str]:
-    result = set()
-    reversed_graph = execution_graph.reverse(copy=True)
-    for pointed_node in pointed_nodes:
-        nodes_reaching_pointed_one = list(
-            nx.dfs_postorder_nodes(reversed_graph, pointed_node)
-        )
-        result.update(nodes_reaching_pointed_one)
+    # multi-source BFS over predecessors replaces reversing a copy of the
+    # whole graph and running a separate DFS per pointed node
+    result = set(pointed_nodes)
+    nodes_to_visit = deque(pointed_nodes)
+    while nodes_to_visit:
+        node = nodes_to_visit.popleft()
+        for predecessor in execution_graph.predecessors(node):
+            if predecessor not in result:
+                result.add(predecessor)
+                nodes_to_visit.append(predecessor)
     return result
 
 
 def verify_each_node_step_has_parent_in_the_same_branch(
     execution_graph: DiGraph,
+    nodes_by_kind: Dict[str, Set[str]],
 ) -> None:
     """
     Conditional branching creates a bit of mess, in terms of determining which
@@ -449,71 +517,167 @@ def verify_each_node_step_has_parent_in_the_same_branch(
     so expected number of iterations in main loop is low - let's say 1-3 for a real graph.
     * for any reasonable execution graph, the complexity should be acceptable.
     """
-    steps_with_more_than_one_parent = detect_steps_with_more_than_one_parent_step(
-        execution_graph=execution_graph
+    steps_nodes = nodes_by_kind.get(STEP_NODE_KIND, set())
+    projection = project_steps_graph(
+        execution_graph=execution_graph,
+        steps_nodes=steps_nodes,
     )  # O(V+E)
+    steps_with_more_than_one_parent = detect_steps_with_more_than_one_parent_step(
+        projection=projection,
+    )  # O(V)
     if not steps_with_more_than_one_parent:
         return None
-    reversed_steps_graph = construct_reversed_graph_with_steps_only(
-        execution_graph=execution_graph
-    )  # O(V+E)
-    reversed_topological_order = list(
-        nx.topological_sort(reversed_steps_graph)
-    )  # O(V+E)
+    flow_control_steps = {
+        index
+        for index, node in enumerate(projection.nodes)
+        if is_flow_control_step(execution_graph=execution_graph, node=node)
+    }  # O(V)
+    if not flow_control_steps:
+        # without flow-control steps there are no execution branches that
+        # could collide - full path analysis can be skipped
+        return None
+    # topological order of the reversed graph is the forward order reversed
+    forward_topological_order = get_steps_topological_order(
+        execution_graph=execution_graph,
+        projection=projection,
+    )  # O(V+E), cached on the graph
+    reversed_topological_order = [
+        projection.index_of[node] for node in forward_topological_order
+    ]
+    reversed_topological_order.reverse()
+    reachable_from = compute_reachability_map(
+        successors=projection.predecessors,
+        topological_order=reversed_topological_order,
+    )  # O(V+E) integer ORs
     for step in steps_with_more_than_one_parent:  # O(V)
         verify_multi_parent_step_execution_paths(
-            reversed_steps_graph=reversed_steps_graph,
+            projection=projection,
             reversed_topological_order=reversed_topological_order,
+            reachable_from=reachable_from,
             step=step,
+            flow_control_steps=flow_control_steps,
         )
 
 
-def detect_steps_with_more_than_one_parent_step(execution_graph: DiGraph) -> Set[str]:
-    steps_nodes = get_nodes_of_specific_kind(
-        execution_graph=execution_graph,
-        kind=STEP_NODE_KIND,
-    )
-    edges_of_steps_nodes = [edge for edge in execution_graph.edges()]
-    steps_parents = defaultdict(set)
-    for edge in edges_of_steps_nodes:
-        parent, child = edge
-        if parent not in steps_nodes or child not in steps_nodes:
+@dataclass(frozen=True)
+class StepsGraphProjection:
+    """Steps-only sub-graph projected onto integer node ids.
+
+    Inner verification passes visit nodes many times - plain list indexing
+    is far cheaper per visit than networkx nested-dict lookups.
+    """
+
+    nodes: List[str]
+    index_of: Dict[str, int]
+    successors: List[List[int]]
+    predecessors: List[List[int]]
+
+
+def project_steps_graph(
+    execution_graph: DiGraph,
+    steps_nodes: Set[str],
+) -> StepsGraphProjection:
+    # node ids follow graph insertion order - enumerating the set directly
+    # would make bit positions (and verifier tie-breaking) depend on
+    # per-process string-hash randomization
+    nodes = [node for node in execution_graph.nodes if node in steps_nodes]
+    index_of = {node: index for index, node in enumerate(nodes)}
+    successors = [[] for _ in nodes]
+    predecessors = [[] for _ in nodes]
+    for edge_start, edge_end in execution_graph.edges():
+        start_index = index_of.get(edge_start)
+        end_index = index_of.get(edge_end)
+        if start_index is None or end_index is None:
             continue
-        steps_parents[child].add(parent)
-    return {key for key, value in steps_parents.items() if len(value) > 1}
+        successors[start_index].append(end_index)
+        predecessors[end_index].append(start_index)
+    return StepsGraphProjection(
+        nodes=nodes,
+        index_of=index_of,
+        successors=successors,
+        predecessors=predecessors,
+    )
 
 
-def construct_reversed_graph_with_steps_only(execution_graph: DiGraph) -> DiGraph:
-    reversed_steps_graph = execution_graph.reverse()
-    for node, node_data in list(reversed_steps_graph.nodes(data=True)):
-        if node_data.get("kind") != STEP_NODE_KIND:
-            reversed_steps_graph.remove_node(node)
-    return reversed_steps_graph
+def get_steps_topological_order(
+    execution_graph: DiGraph,
+    projection: StepsGraphProjection,
+) -> List[str]:
+    # order is stashed in graph-level attributes, so that any verifier (or
+    # later compilation stage) operating on the same graph reuses one sort
+    cached_order = execution_graph.graph.get(STEPS_TOPOLOGICAL_ORDER_KEY)
+    if cached_order is None:
+        cached_order = steps_topological_sort(projection=projection)
+        execution_graph.graph[STEPS_TOPOLOGICAL_ORDER_KEY] = cached_order
+    return cached_order
+
+
+def steps_topological_sort(projection: StepsGraphProjection) -> List[str]:
+    # Kahn's algorithm over the adjacency arrays
+    in_degree = [len(parents) for parents in projection.predecessors]
+    nodes_to_visit = deque(
+        index for index, degree in enumerate(in_degree) if degree == 0
+    )
+    order = []
+    while nodes_to_visit:
+        node = nodes_to_visit.popleft()
+        order.append(projection.nodes[node])
+        for successor in projection.successors[node]:
+            in_degree[successor] -= 1
+            if in_degree[successor] == 0:
+                nodes_to_visit.append(successor)
+    return order
+
+
+def compute_reachability_map(
+    successors: List[List[int]],
+    topological_order: List[int],
+) -> List[int]:
+    # topological DP - each node collects a bitmask of the nodes it is
+    # reachable from (itself included); node id doubles as bit position,
+    # so union is integer OR and membership a single bit test
+    reachable_from = [1 << node for node in range(len(successors))]
+    for node in topological_order:
+        node_sources = reachable_from[node]
+        for successor in successors[node]:
+            reachable_from[successor] |= node_sources
+    return reachable_from
+
+
+def detect_steps_with_more_than_one_parent_step(
+    projection: StepsGraphProjection,
+) -> List[int]:
+    return [
+        index
+        for index, parents in enumerate(projection.predecessors)
+        if len(parents) > 1
+    ]
 
 
 def verify_multi_parent_step_execution_paths(
-    reversed_steps_graph: nx.DiGraph,
-    reversed_topological_order: List[str],
-    step: str,
+    projection: StepsGraphProjection,
+    reversed_topological_order: List[int],
+    reachable_from: List[int],
+    step: int,
+    flow_control_steps: Set[int],
 ) -> None:
     control_flow_steps_successors = defaultdict(set)
     max_conditions_steps_in_execution_branch = 0
-    for parent_of_investigated_step in reversed_steps_graph.successors(step):  # O(V)
-        reversed_flow_path = (
-            construct_path_to_step_through_selected_parent(  # O(E) -> O(V^2)
-                graph=reversed_steps_graph,
-                topological_order=reversed_topological_order,
-                parent_step=parent_of_investigated_step,
-                step=step,
-            )
-        )
+    parents_of_investigated_step = projection.predecessors[step]
+    reversed_flow_paths = construct_paths_to_step_through_parents(  # O(V)
+        topological_order=reversed_topological_order,
+        reachable_from=reachable_from,
+        parents=parents_of_investigated_step,
+        step=step,
+    )
+    for reversed_flow_path in reversed_flow_paths:
         (
             control_flow_steps_successors,
             condition_steps,
         ) = denote_flow_control_steps_successors_in_normal_flow(  # O(V)
-            reversed_steps_graph=reversed_steps_graph,
             reversed_flow_path=reversed_flow_path,
             control_flow_steps_successors=control_flow_steps_successors,
+            flow_control_steps=flow_control_steps,
         )
         max_conditions_steps_in_execution_branch = max(
             condition_steps, max_conditions_steps_in_execution_branch
@@ -528,35 +692,41 @@ def verify_multi_parent_step_execution_paths(
     for condition_step, potential_next_steps in control_flow_steps_successors.items():
         if len(potential_next_steps) > 1:
             raise ConditionalBranchesCollapseError(
-                public_message=f"In execution graph, in flow-control step: {condition_step} there are originated "
-                f"workflow branches that clashes together.",
+                public_message=f"In execution graph, in flow-control step: {projection.nodes[condition_step]} "
+                f"there are originated workflow branches that clashes together.",
                 context="workflow_compilation | execution_graph_construction",
             )
 
 
-def construct_path_to_step_through_selected_parent(
-    graph: nx.DiGraph,
-    topological_order: List[str],
-    parent_step: str,
-    step: str,
-) -> List[str]:
-    normal_flow_path_nodes = nx.descendants(graph, parent_step)
-    normal_flow_path_nodes.add(parent_step)
-    normal_flow_path_nodes.add(step)
-    return [n for n in topological_order if n in normal_flow_path_nodes]
+def construct_paths_to_step_through_parents(
+    topological_order: List[int],
+    reachable_from: List[int],
+    parents: List[int],
+    step: int,
+) -> List[List[int]]:
+    # paths are read out of the precomputed reachability map - node belongs
+    # to the path through given parent if it is reachable from that parent
+    paths = [[] for _ in parents]
+    parents_bits = [1 << parent for parent in parents]
+    for node in topological_order:
+        node_sources = reachable_from[node]
+        for parent_path, parent_bit in zip(paths, parents_bits):
+            if node == step or node_sources & parent_bit:
+                parent_path.append(node)
+    return paths
 
 
 def denote_flow_control_steps_successors_in_normal_flow(
-    reversed_steps_graph: nx.DiGraph,
-    reversed_flow_path: List[str],
-    control_flow_steps_successors: Dict[str, Set[str]],
-) -> Tuple[Dict[str, Set[str]], int]:
+    reversed_flow_path: List[int],
+    control_flow_steps_successors: Dict[int, Set[int]],
+    flow_control_steps: Set[int],
+) -> Tuple[Dict[int, Set[int]], int]:
     conditions_steps = 0
     if not reversed_flow_path:
         return control_flow_steps_successors, conditions_steps
     previous_node = reversed_flow_path[0]
     for node in reversed_flow_path[1:]:
-        if is_flow_control_step(execution_graph=reversed_steps_graph, node=node):
+        if node in flow_control_steps:
             control_flow_steps_successors[node].add(previous_node)
             conditions_steps += 1
         previous_node = node
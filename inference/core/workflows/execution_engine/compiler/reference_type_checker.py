@@ -9,12 +9,19 @@ def validate_reference_kinds(
     actual: List[Kind],
     error_message: str,
 ) -> None:
-    expected_kind_names = set(e.name for e in expected)
-    actual_kind_names = set(a.name for a in actual)
-    if "*" in expected_kind_names or "*" in actual_kind_names:
-        return None
-    if len(expected_kind_names.intersection(actual_kind_names)) == 0:
+    if not reference_kinds_compatible(expected=expected, actual=actual):
         raise ReferenceTypeError(
             public_message=error_message,
             context="workflow_compilation | execution_graph_construction",
         )
+
+
+def reference_kinds_compatible(
+    expected: List[Kind],
+    actual: List[Kind],
+) -> bool:
+    expected_kind_names = set(e.name for e in expected)
+    actual_kind_names = set(a.name for a in actual)
+    if "*" in expected_kind_names or "*" in actual_kind_names:
+        return True
+    return len(expected_kind_names.intersection(actual_kind_names)) > 0
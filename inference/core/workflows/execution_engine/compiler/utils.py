@@ -1,4 +1,5 @@
-from typing import Any, List, Set
+from collections import defaultdict
+from typing import Any, Dict, List, Set
 
 from networkx import DiGraph
 
@@ -71,6 +72,13 @@ def get_nodes_of_specific_kind(execution_graph: DiGraph, kind: str) -> Set[str]:
     }
 
 
+def group_nodes_by_kind(execution_graph: DiGraph) -> Dict[str, Set[str]]:
+    result = defaultdict(set)
+    for node, node_data in execution_graph.nodes(data=True):
+        result[node_data.get("kind")].add(node)
+    return result
+
+
 def get_last_chunk_of_selector(selector: str) -> str:
     return selector.split(".")[-1]
 
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 from inference.core.workflows.entities.base import OutputDefinition
 from inference.core.workflows.errors import (
@@ -6,8 +6,6 @@ from inference.core.workflows.errors import (
     InvalidBlockBehaviourError,
 )
 from inference.core.workflows.execution_engine.compiler.utils import (
-    get_last_chunk_of_selector,
-    get_step_selector_from_its_output,
     is_step_output_selector,
 )
 
@@ -115,7 +113,8 @@ class ExecutionCache:
             ) from e
 
     def get_output(self, selector: str) -> List[Any]:
-        if not self.is_value_registered(selector=selector):
+        resolved_selector = self._resolve_step_output_selector(selector=selector)
+        if resolved_selector is None:
             raise ExecutionEngineRuntimeError(
                 public_message=f"Error in execution engine. Attempted to get output which is not registered using "
                 f"step {selector}. That behavior should be prevented by workflows compiler, so "
@@ -125,9 +124,7 @@ class ExecutionCache:
                 f"the problem - including workflow definition you use.",
                 context="workflow_execution | step_output_registration",
             )
-        step_selector = get_step_selector_from_its_output(step_output_selector=selector)
-        step_name = get_last_chunk_of_selector(selector=step_selector)
-        property_name = get_last_chunk_of_selector(selector=selector)
+        step_name, property_name = resolved_selector
         return self._cache_content[step_name].get_outputs(property_name=property_name)
 
     def get_all_step_outputs(self, step_name: str) -> List[Dict[str, Any]]:
@@ -144,7 +141,8 @@ class ExecutionCache:
         return self._cache_content[step_name].get_all_outputs()
 
     def output_represent_batch(self, selector: str) -> bool:
-        if not self.is_value_registered(selector=selector):
+        resolved_selector = self._resolve_step_output_selector(selector=selector)
+        if resolved_selector is None:
             raise ExecutionEngineRuntimeError(
                 public_message=f"Error in execution engine. Attempted to get batches compatibility status "
                 f"from step {selector} which is not register in cache. That behavior should be prevented by "
@@ -154,21 +152,24 @@ class ExecutionCache:
                 f"the problem - including workflow definition you use.",
                 context="workflow_execution | step_output_registration",
             )
-        step_selector = get_step_selector_from_its_output(step_output_selector=selector)
-        step_name = get_last_chunk_of_selector(selector=step_selector)
+        step_name, _ = resolved_selector
         return self._batches_compatibility[step_name]
 
     def is_value_registered(self, selector: Any) -> bool:
-        if not is_step_output_selector(selector_or_value=selector):
-            return False
-        step_selector = get_step_selector_from_its_output(step_output_selector=selector)
-        step_name = get_last_chunk_of_selector(selector=step_selector)
-        if not self.contains_step(step_name=step_name):
-            return False
-        property_name = get_last_chunk_of_selector(selector=selector)
-        return self._cache_content[step_name].is_property_defined(
-            property_name=property_name
-        )
+        return self._resolve_step_output_selector(selector=selector) is not None
 
     def contains_step(self, step_name: str) -> bool:
         return step_name in self._cache_content
+
+    def _resolve_step_output_selector(self, selector: Any) -> Optional[Tuple[str, str]]:
+        # parses selector into (step_name, property_name) in a single pass,
+        # returning None if selector does not point to registered step output
+        if not is_step_output_selector(selector_or_value=selector):
+            return None
+        _, step_name, property_name = selector.split(".")
+        step_cache = self._cache_content.get(step_name)
+        if step_cache is None or not step_cache.is_property_defined(
+            property_name=property_name
+        ):
+            return None
+        return step_name, property_name
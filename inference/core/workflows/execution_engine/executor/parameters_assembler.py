@@ -56,6 +56,11 @@ def retrieve_value(
     execution_cache: ExecutionCache,
     accepts_batch_input: bool,
 ) -> Any:
+    if not isinstance(value, str):
+        # only strings can be selectors - skipping dispatch avoids
+        # stringification of arbitrary values (including np.ndarray)
+        # in the selector predicates below
+        return value
     if is_step_output_selector(selector_or_value=value):
         value = retrieve_step_output(
             selector=value,
@@ -1,20 +1,19 @@
 from collections import defaultdict
-from typing import Dict, Generator, List, Set, Tuple, Type
+from typing import Dict, FrozenSet, List, Set, Tuple, Type
 
+from inference.core.workflows.entities.base import OutputDefinition
 from inference.core.workflows.entities.types import (
     STEP_AS_SELECTED_ELEMENT,
     STEP_OUTPUT_AS_SELECTED_ELEMENT,
     WILDCARD_KIND,
 )
 from inference.core.workflows.execution_engine.introspection.entities import (
-    BlockDescription,
     BlockManifestMetadata,
     BlockPropertyPrimitiveDefinition,
     BlockPropertySelectorDefinition,
     BlocksConnections,
     BlocksDescription,
     DiscoveredConnections,
-    ReferenceDefinition,
     SelectorDefinition,
 )
 from inference.core.workflows.execution_engine.introspection.schema_parser import (
@@ -25,213 +24,382 @@ from inference.core.workflows.prototypes.block import (
     WorkflowBlockManifest,
 )
 
+DISCOVERED_CONNECTIONS_CACHE: Dict[Tuple[int, ...], DiscoveredConnections] = {}
+PARSED_SCHEMAS_CACHE: Dict[Type[WorkflowBlock], BlockManifestMetadata] = {}
+
+
+def clear_discovered_connections_cache() -> None:
+    DISCOVERED_CONNECTIONS_CACHE.clear()
+    PARSED_SCHEMAS_CACHE.clear()
+
 
 def discover_blocks_connections(
     blocks_description: BlocksDescription,
 ) -> DiscoveredConnections:
+    # parallel arrays of the fields traversed below - loops unpack tuples
+    # instead of repeating attribute lookups on BlockDescription objects
+    (
+        block_classes,
+        block_schemas,
+        outputs_manifests,
+        manifest_type_identifiers,
+    ) = enlist_blocks_attributes(blocks_description=blocks_description)
+    # discovery result depends only on the set of block classes, which is
+    # static for a process lifetime in typical deployments - repeated calls
+    # (one per workflow compilation) collapse into a dict lookup
+    cache_key = tuple(sorted(id(block_class) for block_class in block_classes))
+    cached_connections = DISCOVERED_CONNECTIONS_CACHE.get(cache_key)
+    if cached_connections is not None:
+        return cached_connections
     block_type2manifest_type = {
         block.block_class: block.manifest_class for block in blocks_description.blocks
     }
-    all_schemas = parse_all_schemas(blocks_description=blocks_description)
-    output_kind2schemas = get_all_outputs_kind_major(
-        blocks_description=blocks_description
+    all_schemas = parse_all_schemas(
+        block_classes=block_classes,
+        block_schemas=block_schemas,
     )
-    detailed_input_kind2schemas = get_all_inputs_kind_major(
-        blocks_description=blocks_description,
-        all_schemas=all_schemas,
+    # selectors are walked by the kind-major pass and again per block in
+    # input discovery - materializing the dict-values views once avoids
+    # rebuilding them on every traversal
+    selectors_by_block = {
+        block_class: tuple(metadata.selectors.values())
+        for block_class, metadata in all_schemas.items()
+    }
+    block_bits = {
+        block_class: 1 << index for index, block_class in enumerate(block_classes)
+    }
+    output_kind2bitmap, detailed_input_kind2schemas = build_kind_major_mappings(
+        block_classes=block_classes,
+        outputs_manifests=outputs_manifests,
+        manifest_type_identifiers=manifest_type_identifiers,
+        selectors_by_block=selectors_by_block,
+        block_bits=block_bits,
     )
-    coarse_input_kind2schemas = convert_kinds_mapping_to_block_wise_format(
+    input_kind2bitmap = convert_kinds_mapping_to_block_wise_format(
         detailed_input_kind2schemas=detailed_input_kind2schemas,
         compatible_elements={STEP_OUTPUT_AS_SELECTED_ELEMENT},
+        block_bits=block_bits,
     )
-    input_property_wise_connections = {}
-    output_property_wise_connections = {}
-    for block_type in all_schemas.keys():
-        input_property_wise_connections[block_type] = discover_block_input_connections(
-            starting_block=block_type,
-            all_schemas=all_schemas,
-            output_kind2schemas=output_kind2schemas,
-        )
-        manifest_type = block_type2manifest_type[block_type]
-        output_property_wise_connections[block_type] = (
-            discover_block_output_connections(
-                manifest_type=manifest_type,
-                input_kind2schemas=coarse_input_kind2schemas,
-            )
-        )
-    input_block_wise_connections = (
-        convert_property_connections_to_block_wise_connections(
-            property_wise_connections=input_property_wise_connections,
+    # connections are accumulated as integer bitmaps - per-property unions
+    # and block-wise reductions are big-int ORs, decoded into shared
+    # frozensets only once at the end; block-wise unions come out of the
+    # per-property loops directly, with no second traversal of the maps
+    output_connections_by_signature = {}
+    input_property_bitmaps = {}
+    output_property_bitmaps = {}
+    input_block_bitmaps = {}
+    output_block_bitmaps = {}
+    for block_type in all_schemas:
+        input_bitmaps, input_block_bitmap = discover_block_input_connections(
+            selectors=selectors_by_block[block_type],
+            output_kind2bitmap=output_kind2bitmap,
         )
-    )
-    output_block_wise_connections = (
-        convert_property_connections_to_block_wise_connections(
-            property_wise_connections=output_property_wise_connections,
+        output_bitmaps, output_block_bitmap = discover_block_output_connections(
+            manifest_type=block_type2manifest_type[block_type],
+            input_kind2bitmap=input_kind2bitmap,
+            output_connections_by_signature=output_connections_by_signature,
         )
-    )
+        input_property_bitmaps[block_type] = input_bitmaps
+        input_block_bitmaps[block_type] = input_block_bitmap
+        output_property_bitmaps[block_type] = output_bitmaps
+        output_block_bitmaps[block_type] = output_block_bitmap
+    interned_connections = {}
     input_connections = BlocksConnections(
-        property_wise=input_property_wise_connections,
-        block_wise=input_block_wise_connections,
+        property_wise=resolve_property_wise_bitmaps(
+            property_wise_bitmaps=input_property_bitmaps,
+            block_classes=block_classes,
+            interned_connections=interned_connections,
+        ),
+        block_wise=resolve_block_wise_bitmaps(
+            block_wise_bitmaps=input_block_bitmaps,
+            block_classes=block_classes,
+            interned_connections=interned_connections,
+        ),
     )
     output_connections = BlocksConnections(
-        property_wise=output_property_wise_connections,
-        block_wise=output_block_wise_connections,
+        property_wise=resolve_property_wise_bitmaps(
+            property_wise_bitmaps=output_property_bitmaps,
+            block_classes=block_classes,
+            interned_connections=interned_connections,
+        ),
+        block_wise=resolve_block_wise_bitmaps(
+            block_wise_bitmaps=output_block_bitmaps,
+            block_classes=block_classes,
+            interned_connections=interned_connections,
+        ),
     )
     primitives_connections = build_primitives_connections(
         all_schemas=all_schemas,
-        blocks_description=blocks_description,
+        block_classes=block_classes,
+        manifest_type_identifiers=manifest_type_identifiers,
     )
-    return DiscoveredConnections(
+    discovered_connections = DiscoveredConnections(
         input_connections=input_connections,
         output_connections=output_connections,
         kinds_connections=detailed_input_kind2schemas,
         primitives_connections=primitives_connections,
     )
+    DISCOVERED_CONNECTIONS_CACHE[cache_key] = discovered_connections
+    return discovered_connections
 
 
-def parse_all_schemas(
+def enlist_blocks_attributes(
     blocks_description: BlocksDescription,
-) -> Dict[Type[WorkflowBlock], BlockManifestMetadata]:
-    return {
-        block.block_class: parse_block_manifest_schema(schema=block.block_schema)
-        for block in blocks_description.blocks
-    }
+) -> Tuple[
+    List[Type[WorkflowBlock]], List[dict], List[List[OutputDefinition]], List[str]
+]:
+    block_classes = []
+    block_schemas = []
+    outputs_manifests = []
+    manifest_type_identifiers = []
+    for block in blocks_description.blocks:
+        block_classes.append(block.block_class)
+        block_schemas.append(block.block_schema)
+        outputs_manifests.append(block.outputs_manifest)
+        manifest_type_identifiers.append(block.manifest_type_identifier)
+    return block_classes, block_schemas, outputs_manifests, manifest_type_identifiers
 
 
-def get_all_outputs_kind_major(
-    blocks_description: BlocksDescription,
-) -> Dict[str, Set[Type[WorkflowBlock]]]:
-    kind_major_step_outputs = defaultdict(set)
-    for block in blocks_description.blocks:
-        kind_major_step_outputs[WILDCARD_KIND.name].add(block.block_class)
-        for output in block.outputs_manifest:
-            for kind in output.kind:
-                kind_major_step_outputs[kind.name].add(block.block_class)
-    return kind_major_step_outputs
+def parse_all_schemas(
+    block_classes: List[Type[WorkflowBlock]],
+    block_schemas: List[dict],
+) -> Dict[Type[WorkflowBlock], BlockManifestMetadata]:
+    # manifest schema is a pure function of the block class, so parsed
+    # metadata can be shared across discovery runs
+    result = {}
+    for block_class, block_schema in zip(block_classes, block_schemas):
+        parsed_schema = PARSED_SCHEMAS_CACHE.get(block_class)
+        if parsed_schema is None:
+            parsed_schema = parse_block_manifest_schema(schema=block_schema)
+            PARSED_SCHEMAS_CACHE[block_class] = parsed_schema
+        result[block_class] = parsed_schema
+    return result
 
 
-def get_all_inputs_kind_major(
-    blocks_description: BlocksDescription,
-    all_schemas: Dict[Type[WorkflowBlock], BlockManifestMetadata],
-) -> Dict[str, Set[BlockPropertySelectorDefinition]]:
+def build_kind_major_mappings(
+    block_classes: List[Type[WorkflowBlock]],
+    outputs_manifests: List[List[OutputDefinition]],
+    manifest_type_identifiers: List[str],
+    selectors_by_block: Dict[Type[WorkflowBlock], Tuple[SelectorDefinition, ...]],
+    block_bits: Dict[Type[WorkflowBlock], int],
+) -> Tuple[Dict[str, int], Dict[str, FrozenSet[BlockPropertySelectorDefinition]]]:
+    # single traversal over blocks fills both mappings at once:
+    # * kind name -> bitmap of blocks producing it; with the universe of
+    #   blocks fixed at discovery time, set union becomes integer OR
+    # * kind name -> definitions of selector properties accepting it
+    kind_major_step_outputs = defaultdict(int)
     kind_major_step_inputs = defaultdict(set)
-    for (
-        block_description,
-        selector,
-        allowed_reference,
-    ) in enlist_blocks_selectors_and_references(
-        blocks_description=blocks_description,
-        all_schemas=all_schemas,
+    all_input_definitions = []
+    # constants and per-selector attributes bound to locals - inner loops
+    # run O(blocks x selectors x references x kinds) times
+    step_element = STEP_AS_SELECTED_ELEMENT
+    register_input_definition = all_input_definitions.append
+    # definitions interned by key tuple - references of the same property
+    # and element share one instance, hashed once on construction
+    definitions_intern = {}
+    for block_class, outputs_manifest, manifest_type_identifier in zip(
+        block_classes, outputs_manifests, manifest_type_identifiers
     ):
-        if allowed_reference.selected_element == STEP_AS_SELECTED_ELEMENT:
-            continue
-        for single_kind in allowed_reference.kind:
-            kind_major_step_inputs[single_kind.name].add(
-                BlockPropertySelectorDefinition(
-                    block_type=block_description.block_class,
-                    manifest_type_identifier=block_description.manifest_type_identifier,
-                    property_name=selector.property_name,
-                    property_description=selector.property_description,
-                    compatible_element=allowed_reference.selected_element,
-                    is_list_element=selector.is_list_element,
-                )
-            )
-        kind_major_step_inputs[WILDCARD_KIND.name].add(
-            BlockPropertySelectorDefinition(
-                block_type=block_description.block_class,
-                manifest_type_identifier=block_description.manifest_type_identifier,
-                property_name=selector.property_name,
-                property_description=selector.property_description,
-                compatible_element=allowed_reference.selected_element,
-                is_list_element=selector.is_list_element,
-            )
-        )
-    return kind_major_step_inputs
-
-
-def enlist_blocks_selectors_and_references(
-    blocks_description: BlocksDescription,
-    all_schemas: Dict[Type[WorkflowBlock], BlockManifestMetadata],
-) -> Generator[
-    Tuple[BlockDescription, SelectorDefinition, ReferenceDefinition], None, None
-]:
-    for block_description in blocks_description.blocks:
-        for selector in all_schemas[block_description.block_class].selectors.values():
+        block_bit = block_bits[block_class]
+        for output in outputs_manifest:
+            for kind in output.kind:
+                kind_major_step_outputs[kind.name] |= block_bit
+        for selector in selectors_by_block[block_class]:
+            property_name = selector.property_name
+            property_description = selector.property_description
+            is_list_element = selector.is_list_element
             for allowed_reference in selector.allowed_references:
-                yield block_description, selector, allowed_reference
+                selected_element = allowed_reference.selected_element
+                if selected_element == step_element:
+                    continue
+                # definition fields do not depend on the kind - one instance
+                # can be registered under every kind name
+                definition_key = (
+                    block_class,
+                    property_name,
+                    selected_element,
+                    is_list_element,
+                )
+                definition = definitions_intern.get(definition_key)
+                if definition is None:
+                    definition = BlockPropertySelectorDefinition(
+                        block_type=block_class,
+                        manifest_type_identifier=manifest_type_identifier,
+                        property_name=property_name,
+                        property_description=property_description,
+                        compatible_element=selected_element,
+                        is_list_element=is_list_element,
+                    )
+                    definitions_intern[definition_key] = definition
+                    register_input_definition(definition)
+                for single_kind in allowed_reference.kind:
+                    kind_major_step_inputs[single_kind.name].add(definition)
+    # wildcard entries are derived once after the loop instead of being
+    # populated alongside every specific kind: every block produces the
+    # wildcard output kind and every definition accepts it
+    kind_major_step_outputs[WILDCARD_KIND.name] = (1 << len(block_classes)) - 1
+    # plain dict on return - downstream lookups skip defaultdict __missing__
+    # machinery and cannot grow the mappings as a side effect; input values
+    # are frozen, as the map is exposed (and cached) as kinds_connections
+    frozen_kind_major_step_inputs = {
+        kind_name: frozenset(definitions)
+        for kind_name, definitions in kind_major_step_inputs.items()
+    }
+    frozen_kind_major_step_inputs[WILDCARD_KIND.name] = frozenset(all_input_definitions)
+    return dict(kind_major_step_outputs), frozen_kind_major_step_inputs
 
 
 def discover_block_input_connections(
-    starting_block: Type[WorkflowBlock],
-    all_schemas: Dict[Type[WorkflowBlock], BlockManifestMetadata],
-    output_kind2schemas: Dict[str, Set[Type[WorkflowBlock]]],
-) -> Dict[str, Set[Type[WorkflowBlock]]]:
-    result = {}
-    for selector in all_schemas[starting_block].selectors.values():
-        blocks_matching_property = set()
+    selectors: Tuple[SelectorDefinition, ...],
+    output_kind2bitmap: Dict[str, int],
+) -> Tuple[Dict[str, int], int]:
+    # pairs buffer + single dict() build replaces per-selector dict stores;
+    # the block-wise union accumulates alongside the per-property bitmaps
+    property_bitmap_pairs = []
+    block_bitmap = 0
+    step_output_element = STEP_OUTPUT_AS_SELECTED_ELEMENT
+    get_kind_bitmap = output_kind2bitmap.get
+    for selector in selectors:
+        matching_blocks_bitmap = 0
         for allowed_reference in selector.allowed_references:
-            if allowed_reference.selected_element != STEP_OUTPUT_AS_SELECTED_ELEMENT:
+            if allowed_reference.selected_element != step_output_element:
                 continue
             for single_kind in allowed_reference.kind:
-                blocks_matching_property.update(
-                    output_kind2schemas.get(single_kind.name, set())
-                )
-        result[selector.property_name] = blocks_matching_property
-    return result
+                matching_blocks_bitmap |= get_kind_bitmap(single_kind.name, 0)
+        property_bitmap_pairs.append((selector.property_name, matching_blocks_bitmap))
+        block_bitmap |= matching_blocks_bitmap
+    return dict(property_bitmap_pairs), block_bitmap
 
 
 def discover_block_output_connections(
     manifest_type: Type[WorkflowBlockManifest],
-    input_kind2schemas: Dict[str, Set[Type[WorkflowBlock]]],
-) -> Dict[str, Set[Type[WorkflowBlock]]]:
-    result = {}
-    for output in manifest_type.describe_outputs():
-        compatible_blocks = set()
-        for single_kind in output.kind:
-            compatible_blocks.update(input_kind2schemas[single_kind.name])
-        result[output.name] = compatible_blocks
-    return result
-
-
-def convert_property_connections_to_block_wise_connections(
-    property_wise_connections: Dict[
-        Type[WorkflowBlock], Dict[str, Set[Type[WorkflowBlock]]]
+    input_kind2bitmap: Dict[str, int],
+    output_connections_by_signature: Dict[
+        Tuple[Tuple[str, Tuple[str, ...]], ...], Tuple[Dict[str, int], int]
     ],
-) -> Dict[Type[WorkflowBlock], Set[Type[WorkflowBlock]]]:
-    result = {}
-    for block_type, properties_connections in property_wise_connections.items():
-        block_connections = set()
-        for property_connections in properties_connections.values():
-            block_connections.update(property_connections)
-        result[block_type] = block_connections
+) -> Tuple[Dict[str, int], int]:
+    # many blocks declare identical output manifests - connections are
+    # memoized by outputs signature and the shared result consumed read-only
+    outputs = manifest_type.describe_outputs()
+    signature = tuple(
+        (output.name, tuple(kind.name for kind in output.kind)) for output in outputs
+    )
+    cached_connections = output_connections_by_signature.get(signature)
+    if cached_connections is not None:
+        return cached_connections
+    output_bitmap_pairs = []
+    block_bitmap = 0
+    for output in outputs:
+        compatible_blocks_bitmap = 0
+        for single_kind in output.kind:
+            compatible_blocks_bitmap |= input_kind2bitmap.get(single_kind.name, 0)
+        output_bitmap_pairs.append((output.name, compatible_blocks_bitmap))
+        block_bitmap |= compatible_blocks_bitmap
+    result = (dict(output_bitmap_pairs), block_bitmap)
+    output_connections_by_signature[signature] = result
     return result
 
 
 def convert_kinds_mapping_to_block_wise_format(
-    detailed_input_kind2schemas: Dict[str, Set[BlockPropertySelectorDefinition]],
+    detailed_input_kind2schemas: Dict[str, FrozenSet[BlockPropertySelectorDefinition]],
     compatible_elements: Set[str],
-) -> Dict[str, Set[Type[WorkflowBlock]]]:
-    result = defaultdict(set)
+    block_bits: Dict[Type[WorkflowBlock], int],
+) -> Dict[str, int]:
+    result = defaultdict(int)
+    if len(compatible_elements) == 1:
+        # the only call site passes a singleton - a direct string comparison
+        # in the innermost loop is cheaper than a set-membership probe
+        (compatible_element,) = compatible_elements
+        for (
+            kind_name,
+            block_properties_definitions,
+        ) in detailed_input_kind2schemas.items():
+            for definition in block_properties_definitions:
+                if definition.compatible_element == compatible_element:
+                    result[kind_name] |= block_bits[definition.block_type]
+        return dict(result)
     for kind_name, block_properties_definitions in detailed_input_kind2schemas.items():
         for definition in block_properties_definitions:
             if definition.compatible_element not in compatible_elements:
                 continue
-            result[kind_name].add(definition.block_type)
+            result[kind_name] |= block_bits[definition.block_type]
+    return dict(result)
+
+
+def resolve_property_wise_bitmaps(
+    property_wise_bitmaps: Dict[Type[WorkflowBlock], Dict[str, int]],
+    block_classes: List[Type[WorkflowBlock]],
+    interned_connections: Dict[int, FrozenSet[Type[WorkflowBlock]]],
+) -> Dict[Type[WorkflowBlock], Dict[str, FrozenSet[Type[WorkflowBlock]]]]:
+    return {
+        block_type: {
+            property_name: resolve_blocks_bitmap(
+                bitmap=bitmap,
+                block_classes=block_classes,
+                interned_connections=interned_connections,
+            )
+            for property_name, bitmap in bitmaps.items()
+        }
+        for block_type, bitmaps in property_wise_bitmaps.items()
+    }
+
+
+def resolve_block_wise_bitmaps(
+    block_wise_bitmaps: Dict[Type[WorkflowBlock], int],
+    block_classes: List[Type[WorkflowBlock]],
+    interned_connections: Dict[int, FrozenSet[Type[WorkflowBlock]]],
+) -> Dict[Type[WorkflowBlock], FrozenSet[Type[WorkflowBlock]]]:
+    return {
+        block_type: resolve_blocks_bitmap(
+            bitmap=bitmap,
+            block_classes=block_classes,
+            interned_connections=interned_connections,
+        )
+        for block_type, bitmap in block_wise_bitmaps.items()
+    }
+
+
+def resolve_blocks_bitmap(
+    bitmap: int,
+    block_classes: List[Type[WorkflowBlock]],
+    interned_connections: Dict[int, FrozenSet[Type[WorkflowBlock]]],
+) -> FrozenSet[Type[WorkflowBlock]]:
+    # identical unions across properties and blocks frequently repeat -
+    # interning by bitmap lets them share one frozenset instance
+    resolved_blocks = interned_connections.get(bitmap)
+    if resolved_blocks is None:
+        resolved_blocks = frozenset(
+            decode_blocks_bitmap(bitmap=bitmap, block_classes=block_classes)
+        )
+        interned_connections[bitmap] = resolved_blocks
+    return resolved_blocks
+
+
+def decode_blocks_bitmap(
+    bitmap: int,
+    block_classes: List[Type[WorkflowBlock]],
+) -> Set[Type[WorkflowBlock]]:
+    result = set()
+    while bitmap:
+        lowest_bit = bitmap & -bitmap
+        result.add(block_classes[lowest_bit.bit_length() - 1])
+        bitmap ^= lowest_bit
     return result
 
 
 def build_primitives_connections(
     all_schemas: Dict[Type[WorkflowBlock], BlockManifestMetadata],
-    blocks_description: BlocksDescription,
+    block_classes: List[Type[WorkflowBlock]],
+    manifest_type_identifiers: List[str],
 ) -> List[BlockPropertyPrimitiveDefinition]:
     result = []
-    for block in blocks_description.blocks:
-        for property_definition in all_schemas[
-            block.block_class
-        ].primitive_types.values():
+    for block_class, manifest_type_identifier in zip(
+        block_classes, manifest_type_identifiers
+    ):
+        for property_definition in all_schemas[block_class].primitive_types.values():
             definition = BlockPropertyPrimitiveDefinition(
-                block_type=block.block_class,
-                manifest_type_identifier=block.manifest_type_identifier,
+                block_type=block_class,
+                manifest_type_identifier=manifest_type_identifier,
                 property_name=property_definition.property_name,
                 property_description=property_definition.property_description,
                 type_annotation=property_definition.type_annotation,
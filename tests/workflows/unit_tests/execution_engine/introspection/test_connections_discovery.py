@@ -10,6 +10,7 @@ from inference.core.workflows.entities.types import (
     WorkflowParameterSelector,
 )
 from inference.core.workflows.execution_engine.introspection.connections_discovery import (
+    clear_discovered_connections_cache,
     discover_blocks_connections,
 )
 from inference.core.workflows.execution_engine.introspection.entities import (
@@ -294,3 +295,47 @@ def test_discover_blocks_connections_properly_recognises_primitives_connections(
             type_annotation="str",
         ),
     ], "Primitives connections do not match expectations"
+
+
+def test_discover_blocks_connections_returns_cached_result_for_the_same_blocks() -> (
+    None
+):
+    # given
+    clear_discovered_connections_cache()
+
+    # when
+    first_result = discover_blocks_connections(blocks_description=BLOCKS_DESCRIPTION)
+    second_result = discover_blocks_connections(blocks_description=BLOCKS_DESCRIPTION)
+
+    # then
+    assert (
+        first_result is second_result
+    ), "Repeated discovery for the same set of blocks must return the cached object"
+
+
+def test_discover_blocks_connections_recomputes_once_cache_is_cleared() -> None:
+    # given
+    first_result = discover_blocks_connections(blocks_description=BLOCKS_DESCRIPTION)
+
+    # when
+    clear_discovered_connections_cache()
+    second_result = discover_blocks_connections(blocks_description=BLOCKS_DESCRIPTION)
+
+    # then
+    assert (
+        first_result is not second_result
+    ), "After cache invalidation discovery must be recomputed from scratch"
+    assert (
+        first_result.kinds_connections == second_result.kinds_connections
+    ), "Recomputed discovery must match previously cached result"
+
+
+def test_discover_blocks_connections_returns_immutable_kinds_connections() -> None:
+    # when
+    result = discover_blocks_connections(blocks_description=BLOCKS_DESCRIPTION)
+
+    # then
+    for connections in result.kinds_connections.values():
+        assert isinstance(
+            connections, frozenset
+        ), "Cached kinds connections must not be mutable by callers"